@@ -1,7 +1,7 @@
 import os
 
 from tinydb import TinyDB
-from tinydb.middlewares import CachingMiddleware
+from tinydb.middlewares import CachingMiddleware, Middleware
 from tinydb.storages import MemoryStorage, JSONStorage
 
 doc = {'none': [None, None], 'int': 42, 'float': 3.1415899999999999,
@@ -85,6 +85,25 @@ def test_nested():
     assert doc == storage.read()
 
 
+def test_middleware_delegation():
+    class SpyStorage(MemoryStorage):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    storage = Middleware(SpyStorage)()
+
+    storage.write(doc)
+
+    # Verify contents
+    assert doc == storage.read()
+    assert doc == storage.memory
+
+    storage.close()
+    assert storage.storage.closed
+
+
 def test_caching_json_write(tmpdir):
     path = str(tmpdir.join('test.db'))
 
@@ -103,3 +122,46 @@ def test_caching_json_write(tmpdir):
     # Reopen database
     with TinyDB(path, storage=CachingMiddleware(JSONStorage)) as db:
         assert db.all() == [{'key': 'value'}]
+
+
+def test_caching_flush_unmodified(storage):
+    storage.write(doc)
+    storage.flush()
+
+    # Nothing has been written since the last flush, so the underlying
+    # storage must not be touched again
+    storage.storage.memory = None
+    storage.read()
+    storage.flush()
+
+    assert storage.storage.memory is None
+
+
+def test_middleware_storage_without_sync():
+    # A storage that implements the storage interface without subclassing
+    # Storage, so it has no sync() method
+    class DuckStorage:
+        def __init__(self):
+            self.memory = None
+
+        def read(self):
+            return self.memory
+
+        def write(self, data):
+            self.memory = data
+
+        def close(self):
+            pass
+
+    db = TinyDB(storage=CachingMiddleware(DuckStorage))
+    db.insert({'key': 'value'})
+    db.storage.sync()
+    db.close()
+
+    assert db.storage.storage.memory == {'_default': {'1': {'key': 'value'}}}
+
+    storage = Middleware(DuckStorage)()
+    storage.write(doc)
+    storage.sync()
+
+    assert storage.memory == doc
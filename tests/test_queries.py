@@ -1,4 +1,5 @@
 import re
+from enum import Enum
 
 import pytest
 
@@ -130,6 +131,24 @@ def test_and():
     assert hash(query)
 
 
+def test_chained_and_or():
+    q1, q2, q3 = Query().val1 == 1, Query().val2 == 2, Query().val3 == 3
+
+    query = q1 & q2 & q3
+    assert query({'val1': 1, 'val2': 2, 'val3': 3})
+    assert not query({'val1': 1, 'val2': 2})
+    assert query == (q1 & q2) & q3
+
+    query = q1 | q2 | q3
+    assert query({'val3': 3})
+    assert not query({'val1': '', 'val2': '', 'val3': ''})
+
+    query = (q1 & q2) | q3
+    assert query({'val3': 3})
+    assert query({'val1': 1, 'val2': 2})
+    assert not query({'val1': 1})
+
+
 def test_not():
     query = ~ (Query().val1 == 1)
     assert query({'val1': 5, 'val2': 2})
@@ -147,6 +166,11 @@ def test_not():
     assert not query({'val1': '', 'val2': ''})
     assert hash(query)
 
+    query = ~~(Query().val1 == 1)
+    assert query({'val1': 1})
+    assert not query({'val1': 5})
+    assert query != (Query().val1 == 1)
+
 
 def test_has_key():
     query = Query().val3.exists()
@@ -273,6 +297,19 @@ def test_all():
     assert hash(query)
 
 
+def test_any_all_mixed_items():
+    query = Query().followers.any(['don', 'jon'])
+    assert query({'followers': [{'name': 'greg'}, 'don']})
+    assert not query({'followers': [{'name': 'greg'}, 'bill']})
+
+    query = Query().followers.all(['don', 'jon'])
+    assert query({'followers': [{'name': 'greg'}, 'don', 'jon']})
+    assert not query({'followers': [{'name': 'greg'}, 'don']})
+
+    query = Query().key1.one_of(['value 1', 'value 2'])
+    assert not query({'key1': ['value 1']})
+
+
 def test_has():
     query = Query().key1.key2.exists()
     str(query)  # This used to cause a bug...
@@ -367,6 +404,17 @@ def test_hash():
     assert (Query().key2.exists() | Query().key1.exists()) in d
 
 
+def test_hash_equality():
+    query1 = Query().key1 == 2
+    query2 = Query().key1 == 3
+
+    # Compare queries with already computed hashes
+    assert hash(query1) == hash(Query().key1 == 2)
+    assert hash(query1) != hash(query2)
+    assert query1 != query2
+    assert query1 == (Query().key1 == 2)
+
+
 def test_orm_usage():
     data = {'name': 'John', 'age': {'year': 2000}}
 
@@ -443,3 +491,13 @@ def test_get_item():
 
     assert query({'test': 1})
     assert not query({'test': 0})
+
+
+def test_str_subclass_key():
+    class Field(str, Enum):
+        NAME = 'name'
+
+    query = where(Field.NAME) == 'John'
+    assert query({'name': 'John'})
+    assert not query({'name': 'Jane'})
+    assert query == (where('name') == 'John')
@@ -28,6 +28,57 @@ def test_json(tmpdir):
     storage.close()
 
 
+def test_json_binary_mode(tmpdir):
+    path = str(tmpdir.join('test.db'))
+    storage = JSONStorage(path, access_mode='rb+')
+    storage.write(doc)
+
+    # Verify contents
+    assert doc == storage.read()
+    storage.close()
+
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == doc
+
+
+def test_json_custom_serializer(tmpdir):
+    class BytesJSONStorage(JSONStorage):
+        # Mimics libraries like orjson which return bytes
+        _dumps = staticmethod(lambda data, **kwargs: json.dumps(data).encode())
+
+    path = str(tmpdir.join('test.db'))
+    storage = BytesJSONStorage(path)
+    storage.write(doc)
+
+    # Verify contents
+    assert doc == storage.read()
+    storage.close()
+
+
+def test_json_sync_every(tmpdir, monkeypatch):
+    synced = []
+    monkeypatch.setattr(os, 'fsync', synced.append)
+
+    path = str(tmpdir.join('test.db'))
+    storage = JSONStorage(path, sync_every=3)
+
+    storage.write(doc)
+    storage.write(doc)
+    assert len(synced) == 0
+
+    storage.write(doc)
+    assert len(synced) == 1
+
+    # Nothing to sync
+    storage.sync()
+    assert len(synced) == 1
+
+    # Pending writes are synced when closing
+    storage.write(doc)
+    storage.close()
+    assert len(synced) == 2
+
+
 def test_json_kwargs(tmpdir):
     db_file = tmpdir.join('test.db')
     db = TinyDB(str(db_file), sort_keys=True, indent=4, separators=(',', ': '))
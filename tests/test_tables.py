@@ -1,3 +1,4 @@
+import pickle
 import re
 
 import pytest
@@ -169,3 +170,14 @@ def test_table_repr(db):
 def test_truncate_table(db):
     db.truncate()
     assert db._get_next_id() == 1
+
+
+def test_document_pickle(db):
+    doc = db.all()[0]
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps(doc, protocol))
+
+        assert type(restored) is type(doc)
+        assert restored == doc
+        assert restored.doc_id == doc.doc_id
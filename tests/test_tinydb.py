@@ -5,6 +5,7 @@ import pytest
 
 from tinydb import TinyDB, where, Query
 from tinydb.middlewares import Middleware, CachingMiddleware
+from tinydb.operations import increment
 from tinydb.storages import MemoryStorage, JSONStorage
 from tinydb.table import Document
 
@@ -265,6 +266,15 @@ def test_update_ids(db: TinyDB):
     assert db.count(where('int') == 2) == 2
 
 
+def test_update_ids_duplicate_and_missing(db: TinyDB):
+    assert db.update(increment('int'), doc_ids=[1, 1, 99]) == [1]
+    assert db.get(doc_id=1)['int'] == 2
+    assert db.count(where('int') == 1) == 2
+
+    # Updated IDs are returned in the order they were passed in
+    assert db.update({'int': 3}, doc_ids=[3, 2]) == [3, 2]
+
+
 def test_update_multiple(db: TinyDB):
     assert len(db) == 3
 
@@ -376,6 +386,13 @@ def test_get_multiple_ids(db: TinyDB):
     assert db.get(doc_ids=[x.doc_id for x in el]) == el
 
 
+def test_get_ids_converted(db: TinyDB):
+    assert db.get(doc_id='3').doc_id == 3
+
+    docs = db.get(doc_ids=['1', 2])
+    assert [doc.doc_id for doc in docs] == [1, 2]
+
+
 def test_get_invalid(db: TinyDB):
     with pytest.raises(RuntimeError):
         db.get()
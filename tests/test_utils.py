@@ -19,6 +19,44 @@ def test_lru_cache():
     assert cache.lru == ["c", "a", "d"]
 
 
+def test_lru_cache_get_most_recent():
+    cache = LRUCache(capacity=3)
+    cache["a"] = 1
+    cache["b"] = 2
+    _ = cache["b"]
+    _ = cache["a"]
+    _ = cache["a"]
+
+    assert cache.lru == ["b", "a"]
+
+
+def test_lru_cache_len():
+    cache = LRUCache(capacity=2)
+    assert len(cache) == 0
+
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    assert len(cache) == 2
+
+    del cache["b"]
+    assert len(cache) == 1
+
+
+def test_lru_cache_none_key():
+    cache = LRUCache(capacity=3)
+    cache[None] = 1
+    cache["a"] = 2
+    cache["b"] = 3
+    del cache["b"]
+
+    _ = cache[None]  # move to front in lru queue
+    cache["c"] = 4
+    cache["d"] = 5
+
+    assert cache.lru == [None, "c", "d"]
+
+
 def test_lru_cache_set_multiple():
     cache = LRUCache(capacity=3)
     cache["a"] = 1
@@ -106,3 +144,10 @@ def test_freeze():
 
     with pytest.raises(TypeError):
         frozen[3].update({'a': 9})
+
+
+def test_freeze_hash():
+    assert hash(freeze({'a': 1, 'b': 2})) == hash(freeze({'b': 2, 'a': 1}))
+
+    # Keys of different types can't be sorted but still need to be hashable
+    assert hash(freeze({1: 'a', 'b': 2}))
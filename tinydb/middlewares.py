@@ -61,10 +61,41 @@ class Middleware:
         self.storage = self._storage_cls(*args, **kwargs)
         return self
 
+    def read(self):
+        """
+        Read data from the underlying storage.
+        """
+        return self.storage.read()
+
+    def write(self, data):
+        """
+        Write data to the underlying storage.
+        """
+        self.storage.write(data)
+
+    def sync(self):
+        """
+        Persist all data written to the underlying storage.
+
+        Storages that don't implement ``sync()`` are left alone.
+        """
+        sync = getattr(self.storage, 'sync', None)
+        if sync is not None:
+            sync()
+
+    def close(self):
+        """
+        Close the underlying storage.
+        """
+        self.storage.close()
+
     def __getattr__(self, name):
         """
         Forward all unknown attribute calls to the underlying storage, so we
         remain as transparent as possible.
+
+        The storage interface methods are delegated explicitly above, so this
+        is only used for storage specific attributes.
         """
         return getattr(self.__dict__['storage'], name)
 
@@ -107,10 +138,18 @@ class CachingMiddleware(Middleware):
         """
         Flush all unwritten data to disk.
         """
-        if self.cache is not None:
+        if self._cache_modified_count > 0:
+            # Only write if the cache has been modified since the last flush
             self.storage.write(self.cache)
+            super().sync()
             self._cache_modified_count = 0
 
+    def sync(self):
+        """
+        Flush the cache, which also persists the written data.
+        """
+        self.flush()
+
     def close(self):
         """
         Flush the cache and close the storage.
@@ -56,19 +56,11 @@ def increment(field):
     """
     Increment a given field in the document by 1.
     """
-    def transform(doc):
-        if field in doc:
-            doc[field] += 1
-        return doc
-    return transform
+    return add(field, 1)
 
 
 def decrement(field):
     """
     Decrement a given field in the document by 1.
     """
-    def transform(doc):
-        if field in doc:
-            doc[field] -= 1
-        return doc
-    return transform
+    return subtract(field, 1)
@@ -26,6 +26,22 @@ else:
 __all__ = 'Query', 'QueryLike', 'where'
 
 
+def _to_frozenset(items: Any) ->Optional[frozenset]:
+    """
+    Convert a collection of items to a ``frozenset`` that allows testing for
+    membership in constant time.
+
+    Returns ``None`` if the items are not a collection or not all hashable.
+    """
+    if not isinstance(items, (list, tuple, set, frozenset)):
+        return None
+
+    try:
+        return frozenset(items)
+    except TypeError:
+        return None
+
+
 class QueryLike(Protocol):
     """
     A typing protocol that acts like a query.
@@ -75,6 +91,21 @@ class QueryInstance:
         self._test = test
         self._hash = hashval
 
+        # ``hash(self._hash)`` has to walk the whole nested hash value, so
+        # it's computed once on first use and then reused
+        self._hash_int: Optional[int] = None
+
+        # When this query is a logical AND/OR combination or a negation,
+        # ``_op`` holds the operator and ``_operands`` the tests of all
+        # combined queries. This allows chains like ``q1 & q2 & q3`` to be
+        # evaluated as one flat sequence of tests instead of a nested call
+        # per operator.
+        self._op: Optional[str] = None
+        self._operands: Tuple[Callable[[Mapping], bool], ...] = ()
+
+    def is_cacheable(self) ->bool:
+        return self._hash is not None
+
     def __call__(self, value: Mapping) ->bool:
         """
         Evaluate the query to check if it matches a specified value.
@@ -85,13 +116,18 @@ class QueryInstance:
         return self._test(value)
 
     def __hash__(self) ->int:
-        return hash(self._hash)
+        if self._hash_int is None:
+            self._hash_int = hash(self._hash)
+        return self._hash_int
 
     def __repr__(self):
         return 'QueryImpl{}'.format(self._hash)
 
     def __eq__(self, other: object):
         if isinstance(other, QueryInstance):
+            if (self._hash_int is not None and other._hash_int is not None
+                    and self._hash_int != other._hash_int):
+                return False
             return self._hash == other._hash
         return False
 
@@ -100,20 +136,66 @@ class QueryInstance:
             hashval = 'and', frozenset([self._hash, other._hash])
         else:
             hashval = None
-        return QueryInstance(lambda value: self(value) and other(value),
-            hashval)
+        return self._combine(other, 'and', hashval)
 
     def __or__(self, other: 'QueryInstance') ->'QueryInstance':
         if self.is_cacheable() and other.is_cacheable():
             hashval = 'or', frozenset([self._hash, other._hash])
         else:
             hashval = None
-        return QueryInstance(lambda value: self(value) or other(value), hashval
-            )
+        return self._combine(other, 'or', hashval)
+
+    def _tests_for(self, op: str) ->Tuple[Callable[[Mapping], bool], ...]:
+        """
+        Get the tests to evaluate when combining this query using ``op``.
+        """
+        if self._op == op:
+            return self._operands
+        return (self._test,)
+
+    def _combine(self, other: 'QueryInstance', op: str, hashval: Optional[
+        Tuple]) ->'QueryInstance':
+        """
+        Combine this query with another one using a logical AND/OR.
+
+        :param other: The query to combine with.
+        :param op: Either ``'and'`` or ``'or'``.
+        :param hashval: The hash of the combined query.
+        """
+        tests = self._tests_for(op) + other._tests_for(op)
+
+        # Use plain loops here: a generator passed to all()/any() would
+        # create a new frame on every evaluation
+        if op == 'and':
+            def test(value):
+                for t in tests:
+                    if not t(value):
+                        return False
+                return True
+        else:
+            def test(value):
+                for t in tests:
+                    if t(value):
+                        return True
+                return False
+
+        query = QueryInstance(test, hashval)
+        query._op = op
+        query._operands = tests
+        return query
 
     def __invert__(self) ->'QueryInstance':
         hashval = ('not', self._hash) if self.is_cacheable() else None
-        return QueryInstance(lambda value: not self(value), hashval)
+
+        if self._op == 'not':
+            # Negating a negated query: reuse the original test
+            return QueryInstance(self._operands[0], hashval)
+
+        test = self._test
+        query = QueryInstance(lambda value: not test(value), hashval)
+        query._op = 'not'
+        query._operands = (test,)
+        return query
 
 
 class Query(QueryInstance):
@@ -163,6 +245,11 @@ class Query(QueryInstance):
         return super().__hash__()
 
     def __getattr__(self, item: str):
+        if type(item) is str:
+            # Interned keys make comparing the paths of equal queries cheaper.
+            # sys.intern() rejects str subclasses, so leave those as they are
+            item = sys.intern(item)
+
         query = type(self)()
         query._path = self._path + (item,)
         query._hash = ('path', query._path) if self.is_cacheable() else None
@@ -182,20 +269,43 @@ class Query(QueryInstance):
         :return: A :class:`~tinydb.queries.QueryInstance` object
         """
         if not self._path and not allow_empty_path:
-            raise RuntimeError('Query has no path')
-
-        def runner(value):
-            try:
-                for part in self._path:
-                    if isinstance(part, Callable):
-                        value = part(value)
-                    else:
+            raise ValueError('Query has no path')
+
+        path = self._path
+
+        if any(callable(part) for part in path):
+            # Determine once whether each path part is a function added using
+            # ``map()`` or a key, instead of checking it for every document
+            steps = tuple((callable(part), part) for part in path)
+
+            def runner(value):
+                try:
+                    for is_func, part in steps:
+                        value = part(value) if is_func else value[part]
+                    return test(value)
+                except (KeyError, TypeError, ValueError):
+                    return False
+        elif len(path) == 1:
+            # Queries on a top-level field are by far the most common ones,
+            # so avoid setting up a loop for them
+            key, = path
+
+            def runner(value):
+                try:
+                    return test(value[key])
+                except (KeyError, TypeError, ValueError):
+                    return False
+        else:
+            def runner(value):
+                try:
+                    for part in path:
                         value = value[part]
-                return test(value)
-            except (KeyError, TypeError, ValueError):
-                return False
+                    return test(value)
+                except (KeyError, TypeError, ValueError):
+                    return False
 
-        return QueryInstance(runner, hashval)
+        return QueryInstance(runner,
+                             hashval if self.is_cacheable() else None)
 
     def __eq__(self, rhs: Any):
         """
@@ -280,8 +390,10 @@ class Query(QueryInstance):
         :param regex: The regular expression to use for matching
         :param flags: regex flags to pass to ``re.match``
         """
+        pattern = re.compile(regex, flags)
+
         return self._generate_test(
-            lambda value: re.match(regex, value, flags) is not None,
+            lambda value: pattern.match(value) is not None,
             ('matches', self._path, regex, flags)
         )
 
@@ -295,8 +407,10 @@ class Query(QueryInstance):
         :param regex: The regular expression to use for matching
         :param flags: regex flags to pass to ``re.match``
         """
+        pattern = re.compile(regex, flags)
+
         return self._generate_test(
-            lambda value: re.search(regex, value, flags) is not None,
+            lambda value: pattern.search(value) is not None,
             ('search', self._path, regex, flags)
         )
 
@@ -351,7 +465,15 @@ class Query(QueryInstance):
             def test(value):
                 return any(cond(item) for item in value)
         else:
+            cond_set = _to_frozenset(cond)
+
             def test(value):
+                if cond_set is not None:
+                    try:
+                        return not cond_set.isdisjoint(value)
+                    except TypeError:
+                        # The value contains unhashable items
+                        pass
                 return any(item in cond for item in value)
 
         return self._generate_test(test, ('any', self._path, freeze(cond)))
@@ -380,7 +502,15 @@ class Query(QueryInstance):
             def test(value):
                 return all(cond(item) for item in value)
         else:
+            cond_set = _to_frozenset(cond)
+
             def test(value):
+                if cond_set is not None and isinstance(value, list):
+                    try:
+                        return cond_set.issubset(value)
+                    except TypeError:
+                        # The value contains unhashable items
+                        pass
                 return all(item in value for item in cond)
 
         return self._generate_test(test, ('all', self._path, freeze(cond)))
@@ -393,8 +523,18 @@ class Query(QueryInstance):
 
         :param items: The list of items to check with
         """
-        return self._generate_test(lambda value: value in items,
-                                   ('one_of', self._path, freeze(items)))
+        items_set = _to_frozenset(items)
+
+        def test(value):
+            if items_set is not None:
+                try:
+                    return value in items_set
+                except TypeError:
+                    # The value is unhashable
+                    pass
+            return value in items
+
+        return self._generate_test(test, ('one_of', self._path, freeze(items)))
 
     def noop(self) ->QueryInstance:
         """
@@ -411,7 +551,10 @@ class Query(QueryInstance):
         """
         query = type(self)()
         query._path = self._path + (fn,)
-        query._hash = ('path', query._path) if self.is_cacheable() else None
+
+        # The callable may depend on mutable state, so queries using it can't
+        # be cached safely
+        query._hash = None
         return query
 
 
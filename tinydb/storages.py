@@ -7,7 +7,7 @@ import json
 import os
 import warnings
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 __all__ = 'Storage', 'JSONStorage', 'MemoryStorage'
 
 
@@ -21,9 +21,9 @@ def touch(path: str, create_dirs: bool):
     if create_dirs:
         os.makedirs(os.path.dirname(path), exist_ok=True)
     
-    if not os.path.exists(path):
-        with open(path, 'a'):
-            os.utime(path, None)
+    # Create the file atomically, without modifying it if it already exists
+    fd = os.open(path, os.O_CREAT | os.O_WRONLY, 0o666)
+    os.close(fd)
 
 
 class Storage(ABC):
@@ -56,6 +56,13 @@ class Storage(ABC):
         """
         raise NotImplementedError
 
+    def sync(self) ->None:
+        """
+        Optional: Make sure all written data has been persisted, e.g. by
+        flushing OS buffers to disk.
+        """
+        pass
+
     def close(self) ->None:
         """
         Optional: Close open file handles, etc.
@@ -66,10 +73,27 @@ class Storage(ABC):
 class JSONStorage(Storage):
     """
     Store the data in a JSON file.
+
+    .. admonition:: Customization
+
+        The functions used to serialize and deserialize the data can be
+        replaced by overriding the ``_dumps`` and ``_loads`` class attributes,
+        e.g. to use a faster JSON library like ``orjson``::
+
+            class ORJSONStorage(JSONStorage):
+                _dumps = staticmethod(orjson.dumps)
+                _loads = staticmethod(orjson.loads)
+
+        ``_dumps`` is called with the data and the keyword arguments passed
+        to the storage and may return either ``str`` or UTF-8 encoded
+        ``bytes``. ``_loads`` receives the file contents as read from the
+        file handle.
     """
+    _dumps = staticmethod(json.dumps)
+    _loads = staticmethod(json.loads)
 
     def __init__(self, path: str, create_dirs=False, encoding=None,
-        access_mode='r+', **kwargs):
+        access_mode='r+', sync_every: Optional[int]=None, **kwargs):
         """
         Create a new instance.
 
@@ -82,9 +106,14 @@ class JSONStorage(Storage):
         :param path: Where to store the JSON data.
         :param access_mode: mode in which the file is opened (r, r+)
         :type access_mode: str
+        :param sync_every: If set, call :meth:`sync` automatically after
+                           this many writes, so the cost of ``fsync`` is
+                           shared by a batch of writes
         """
         super().__init__()
         self._mode = access_mode
+        self._sync_every = sync_every
+        self._unsynced_writes = 0
         self.kwargs = kwargs
         if access_mode not in ('r', 'rb', 'r+', 'rb+'):
             warnings.warn(
@@ -104,12 +133,16 @@ class JSONStorage(Storage):
 
         Return ``None`` here to indicate that the storage is empty.
         """
+        # Read the whole file at once instead of letting the decoder pull
+        # it in chunk by chunk
         self._handle.seek(0)
-        try:
-            return json.load(self._handle)
-        except json.JSONDecodeError:
+        raw = self._handle.read()
+
+        if not raw:
             return None
 
+        return self._loads(raw)
+
     def write(self, data: Dict[str, Dict[str, Any]]) ->None:
         """
         Write the current state of the database to the storage.
@@ -118,14 +151,49 @@ class JSONStorage(Storage):
 
         :param data: The current state of the database.
         """
+        # Serialize the whole database first so the file is updated using a
+        # single write call instead of one call per JSON fragment
+        serialized: Union[str, bytes] = self._dumps(data, **self.kwargs)
+        if 'b' in self._mode:
+            if isinstance(serialized, str):
+                serialized = serialized.encode(self.encoding or 'utf-8')
+        elif isinstance(serialized, bytes):
+            serialized = serialized.decode('utf-8')
+
         self._handle.seek(0)
-        json.dump(data, self._handle, **self.kwargs)
+        try:
+            self._handle.write(serialized)
+        except io.UnsupportedOperation:
+            raise IOError('Cannot write to the database. Access mode is "{0}"'
+                          .format(self._mode))
+
+        # Ensure the file has been written, then remove any data that is
+        # left over from a previous, longer state
+        self._handle.flush()
         self._handle.truncate()
 
+        self._unsynced_writes += 1
+        if self._sync_every and self._unsynced_writes >= self._sync_every:
+            self.sync()
+
+    def sync(self) ->None:
+        """
+        Flush all written data to disk using ``fsync``.
+
+        Does nothing if there haven't been any writes since the last sync.
+        """
+        if self._unsynced_writes:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            self._unsynced_writes = 0
+
     def close(self) ->None:
         """
         Close open file handles.
         """
+        if self._sync_every:
+            self.sync()
+
         self._handle.close()
 
 
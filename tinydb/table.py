@@ -17,10 +17,20 @@ class Document(dict):
     its ID using ``doc.doc_id``.
     """
 
+    # Store the ID in a slot so documents don't need an instance ``__dict__``
+    __slots__ = ('doc_id',)
+
     def __init__(self, value: Mapping, doc_id: int):
         super().__init__(value)
         self.doc_id = doc_id
 
+    def __reduce__(self):
+        # Classes with ``__slots__`` can't be pickled with protocols 0 and 1
+        # by default, so pass the contents and the ID to the constructor.
+        # Subclasses may still have an instance ``__dict__`` to restore.
+        return (type(self), (dict(self), self.doc_id),
+                getattr(self, '__dict__', None))
+
 
 class Table:
     """
@@ -73,7 +83,7 @@ class Table:
         self._name = name
         self._query_cache: LRUCache[QueryLike, List[Document]
             ] = self.query_cache_class(capacity=cache_size)
-        self._next_id = None
+        self._next_id: Optional[int] = None
 
     def __repr__(self):
         args = ['name={!r}'.format(self.name), 'total={}'.format(len(self)),
@@ -114,9 +124,12 @@ class Table:
         :returns: a list containing the inserted documents' IDs
         """
         doc_ids = []
+
         def updater(table):
             for document in documents:
-                doc_id = self._get_next_id()
+                # Pass the table we're updating so determining the first ID
+                # doesn't have to read the storage again
+                doc_id = self._get_next_id(table)
                 table[doc_id] = document
                 doc_ids.append(doc_id)
         self._update_table(updater)
@@ -129,7 +142,9 @@ class Table:
 
         :returns: a list with all documents.
         """
-        return [self.document_class(doc, self.document_id_class(doc_id))
+        document_class = self.document_class
+        document_id_class = self.document_id_class
+        return [document_class(doc, document_id_class(doc_id))
                 for doc_id, doc in self._read_table().items()]
 
     def search(self, cond: QueryLike) ->List[Document]:
@@ -139,11 +154,26 @@ class Table:
         :param cond: the condition to check against
         :returns: list of matching documents
         """
-        if cond in self._query_cache:
-            return self._query_cache[cond]
+        # Look up the query cache only once. Query hashes are memoized and
+        # dicts compare keys by identity first, so re-running the same query
+        # object neither recomputes its hash nor compares it for equality.
+        cached_results = self._query_cache.get(cond)
+        if cached_results is not None:
+            return cached_results[:]
+
+        # Evaluate the condition on the raw documents and only convert the
+        # matching ones to the document class
+        docs = [self.document_class(doc, self.document_id_class(doc_id))
+                for doc_id, doc in self._read_table().items() if cond(doc)]
+
+        # Only cache the results if the query allows it (e.g. queries that
+        # use ``map()`` with a mutable callable must not be cached)
+        is_cacheable: Callable[[], bool] = getattr(cond, 'is_cacheable',
+                                                   lambda: True)
+        if is_cacheable():
+            # Store a copy so the caller can't modify the cached results
+            self._query_cache[cond] = docs[:]
 
-        docs = [doc for doc in self.all() if cond(doc)]
-        self._query_cache[cond] = docs
         return docs
 
     def get(self, cond: Optional[QueryLike]=None, doc_id: Optional[int]=
@@ -164,23 +194,34 @@ class Table:
         """
         if doc_id is not None:
             table = self._read_table()
-            if doc_id in table:
-                return self.document_class(table[doc_id], self.document_id_class(doc_id))
-            return None
+            raw_doc = table.get(str(doc_id), None)
+            if raw_doc is None:
+                return None
+            return self.document_class(raw_doc,
+                                       self.document_id_class(doc_id))
         
         if doc_ids is not None:
-            docs = []
-            table = self._read_table()
-            for id in doc_ids:
-                if id in table:
-                    docs.append(self.document_class(table[id], self.document_id_class(id)))
-            return docs if docs else None
+            # Look up all documents using C-level iteration and only wrap
+            # the ones that exist
+            doc_ids = list(doc_ids)
+            raw_docs = map(self._read_table().get, map(str, doc_ids))
+            document_class = self.document_class
+            document_id_class = self.document_id_class
+            docs = [document_class(raw_doc, document_id_class(id))
+                    for id, raw_doc in zip(doc_ids, raw_docs)
+                    if raw_doc is not None]
+            return docs or None
         
         if cond is not None:
-            docs = self.search(cond)
-            return docs[0] if docs else None
+            # Stop at the first matching document instead of collecting
+            # (and copying) all search results just to return the first one
+            for raw_id, doc in self._read_table().items():
+                if cond(doc):
+                    return self.document_class(doc,
+                                               self.document_id_class(raw_id))
+            return None
         
-        return None
+        raise RuntimeError('You have to pass either cond or doc_id or doc_ids')
 
     def contains(self, cond: Optional[QueryLike]=None, doc_id: Optional[int
         ]=None) ->bool:
@@ -194,7 +235,7 @@ class Table:
         :param doc_id: the document ID to look for
         """
         if doc_id is not None:
-            return doc_id in self._read_table()
+            return str(doc_id) in self._read_table()
         
         return bool(self.search(cond)) if cond is not None else False
 
@@ -212,14 +253,24 @@ class Table:
         """
         updated_ids = []
 
+        if callable(fields):
+            perform_update = fields
+        else:
+            def perform_update(doc):
+                doc.update(fields)
+
         def updater(table):
-            nonlocal updated_ids
-            for doc_id, doc in table.items():
-                if (doc_ids is None or doc_id in doc_ids) and (cond is None or cond(doc)):
-                    if callable(fields):
-                        fields(doc)
-                    else:
-                        doc.update(fields)
+            if doc_ids is not None:
+                # Only look at the requested documents instead of scanning
+                # the whole table (duplicate IDs are only updated once)
+                candidates = ((doc_id, table.get(doc_id))
+                              for doc_id in dict.fromkeys(doc_ids))
+            else:
+                candidates = table.items()
+
+            for doc_id, doc in candidates:
+                if doc is not None and (cond is None or cond(doc)):
+                    perform_update(doc)
                     updated_ids.append(doc_id)
 
         self._update_table(updater)
@@ -307,6 +358,11 @@ class Table:
 
         :param cond: the condition use
         """
+        # Don't copy the cached results if we only need their count
+        cached_results = self._query_cache.get(cond)
+        if cached_results is not None:
+            return len(cached_results)
+
         return len(self.search(cond))
 
     def clear_cache(self) ->None:
@@ -327,15 +383,24 @@ class Table:
 
         :returns: an iterator over all documents.
         """
+        document_class = self.document_class
+        document_id_class = self.document_id_class
+
         for doc_id, doc in self._read_table().items():
-            yield self.document_class(doc, self.document_id_class(doc_id))
+            yield document_class(doc, document_id_class(doc_id))
 
-    def _get_next_id(self):
+    def _get_next_id(self, table: Optional[Mapping]=None):
         """
         Return the ID for a newly inserted document.
+
+        :param table: the table data to determine the first ID from, if
+                      already available. Otherwise it's read from storage.
         """
         if self._next_id is None:
-            self._next_id = max(self._read_table().keys() or [0]) + 1
+            if table is None:
+                table = self._read_table()
+            self._next_id = max((self.document_id_class(doc_id)
+                                 for doc_id in table), default=0) + 1
         else:
             self._next_id += 1
         return self._next_id
@@ -347,8 +412,17 @@ class Table:
         Documents and doc_ids are NOT yet transformed, as 
         we may not want to convert *all* documents when returning
         only one document for example.
+
+        The data is deliberately not cached here: other tables, other TinyDB
+        instances and other processes may modify the storage at any time.
+        Use the :class:`~tinydb.middlewares.CachingMiddleware` to avoid
+        deserializing the data on every read.
         """
-        return self._storage.read() or {}
+        tables = self._storage.read()
+        if tables is None:
+            return {}
+
+        return tables.get(self._name, {})
 
     def _update_table(self, updater: Callable[[Dict[int, Mapping]], None]):
         """
@@ -363,6 +437,17 @@ class Table:
         As a further optimization, we don't convert the documents into the
         document class, as the table data will *not* be returned to the user.
         """
-        data = self._read_table()
-        updater(data)
-        self._storage.write(data)
+        tables = self._storage.read()
+        if tables is None:
+            tables = {}
+
+        # Convert the document IDs to the document ID class, as they are
+        # stored as strings (JSON only allows strings as object keys)
+        table = {self.document_id_class(doc_id): doc
+                 for doc_id, doc in tables.get(self._name, {}).items()}
+
+        updater(table)
+
+        # Convert the document IDs back to strings
+        tables[self._name] = {str(doc_id): doc for doc_id, doc in table.items()}
+        self._storage.write(tables)
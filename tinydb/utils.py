@@ -1,14 +1,20 @@
 """
 Utility functions.
 """
-from collections import OrderedDict, abc
-from typing import List, Iterator, TypeVar, Generic, Union, Optional, Type, TYPE_CHECKING
+from collections import abc
+from typing import Dict, List, Iterator, TypeVar, Generic, Union, Optional, Type, TYPE_CHECKING
 K = TypeVar('K')
 V = TypeVar('V')
 D = TypeVar('D')
 T = TypeVar('T')
 __all__ = 'LRUCache', 'freeze', 'with_typehint'
 
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Marks that an ``LRUCache`` has no most recently used key, as ``None`` is a
+# valid key
+_MISSING = object()
+
 
 def with_typehint(baseclass: Type[T]):
     """
@@ -35,15 +41,28 @@ class LRUCache(abc.MutableMapping, Generic[K, V]):
     entries in the cache exceeds the cache size, the least-recently accessed
     entry will be discarded.
 
-    This is implemented using an ``OrderedDict``. On every access the accessed
-    entry is moved to the front by re-inserting it into the ``OrderedDict``.
-    When adding an entry and the cache size is exceeded, the last entry will
-    be discarded.
+    This is implemented using a plain ``dict``, which preserves insertion
+    order. On every access the accessed entry is moved to the end by
+    re-inserting it into the ``dict``. When adding an entry and the cache
+    size is exceeded, the first (least-recently used) entry will be
+    discarded.
     """
 
     def __init__(self, capacity=None) ->None:
         self.capacity = capacity
-        self.cache: OrderedDict[K, V] = OrderedDict()
+        self.cache: Dict[K, V] = {}
+
+        # The most recently used key. Tracked explicitly as ``reversed()``
+        # doesn't support dicts before Python 3.8
+        self._newest: object = _MISSING
+
+    @property
+    def lru(self) ->List[K]:
+        return list(self.cache)
+
+    def clear(self) ->None:
+        self.cache.clear()
+        self._newest = _MISSING
 
     def __len__(self) ->int:
         return len(self.cache)
@@ -52,20 +71,34 @@ class LRUCache(abc.MutableMapping, Generic[K, V]):
         return key in self.cache
 
     def __setitem__(self, key: K, value: V) ->None:
-        if key in self.cache:
-            del self.cache[key]
-        elif len(self.cache) >= self.capacity:
-            self.cache.popitem(last=False)
-        self.cache[key] = value
+        cache = self.cache
+        cache.pop(key, None)
+        cache[key] = value
+        self._newest = key
+
+        # Check if the cache is full and we have to remove the oldest entry
+        if self.capacity is not None and len(cache) > self.capacity:
+            oldest = next(iter(cache))
+            del cache[oldest]
+            if oldest is key:
+                self._newest = _MISSING
 
     def __delitem__(self, key: K) ->None:
         del self.cache[key]
+        if key is self._newest:
+            self._newest = _MISSING
 
     def __getitem__(self, key: K) ->V:
-        if key not in self.cache:
-            raise KeyError(key)
-        value = self.cache.pop(key)
-        self.cache[key] = value
+        cache = self.cache
+        value = cache[key]
+
+        # Only move the entry to the end if it isn't the most recent one
+        # already, e.g. when running the same query repeatedly
+        if key is not self._newest:
+            del cache[key]
+            cache[key] = value
+            self._newest = key
+
         return value
 
     def __iter__(self) ->Iterator[K]:
@@ -81,6 +114,10 @@ class LRUCache(abc.MutableMapping, Generic[K, V]):
         self[key] = value
 
 
+def _immutable(self, *args, **kwargs):
+    raise TypeError('object is immutable')
+
+
 class FrozenDict(dict):
     """
     An immutable dictionary.
@@ -91,22 +128,35 @@ class FrozenDict(dict):
     """
 
     def __hash__(self):
-        return hash(tuple(sorted(self.items())))
+        # As the dict can't be modified, its hash only has to be calculated
+        # once. Hashing the items as a frozenset makes the hash independent
+        # of the insertion order without having to sort the items.
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
     __setitem__ = _immutable
     __delitem__ = _immutable
     clear = _immutable
     setdefault = _immutable
     popitem = _immutable
+    update = _immutable
+    pop = _immutable
 
 
 def freeze(obj):
     """
     Freeze an object by making it immutable and thus hashable.
     """
-    if isinstance(obj, dict):
-        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if type(obj) in _SCALAR_TYPES:
+        # Fast path for the most common values that are immutable already
+        return obj
+    elif isinstance(obj, dict):
+        return FrozenDict({k: freeze(v) for k, v in obj.items()})
     elif isinstance(obj, list):
-        return tuple(freeze(i) for i in obj)
+        return tuple([freeze(i) for i in obj])
     elif isinstance(obj, set):
-        return frozenset(freeze(i) for i in obj)
+        return frozenset([freeze(i) for i in obj])
     return obj